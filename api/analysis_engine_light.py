@@ -1,17 +1,39 @@
 import yfinance as yf
-import json
+import numpy as np
+from scipy.special import ndtr
+import httpx
+import orjson
+import asyncio
 import math
+import calendar
+from collections import namedtuple
+import threading
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
 from datetime import datetime
-import time
+from functools import lru_cache
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; the NumPy broadcast pair search is used instead
+    njit = None
 
 # Lightweight analysis engine with minimal dependencies
+@lru_cache(maxsize=4096)
+def _parse_exp(expiration):
+    """Parse a YYYY-MM-DD expiration once; the same strings recur across requests"""
+    return datetime.strptime(expiration, "%Y-%m-%d")
+
+_INV_SQRT_2PI = 1.0 / math.sqrt(2 * math.pi)
+
 def normal_cdf(x):
-    """Approximate normal CDF using error function"""
-    return 0.5 * (1 + math.erf(x / math.sqrt(2)))
+    """Normal CDF (scipy's compiled ndtr ufunc; works on scalars and arrays)"""
+    return ndtr(x)
 
 def normal_pdf(x):
     """Normal PDF"""
-    return math.exp(-0.5 * x * x) / math.sqrt(2 * math.pi)
+    return np.exp(-0.5 * x * x) * _INV_SQRT_2PI
 
 def d1(S, K, T, r, sigma, q=0.0):
     if T <= 0 or sigma <= 0: 
@@ -31,191 +53,302 @@ def bs_delta(S, K, T, r, sigma, option_type='call', q=0.0):
     if T <= 0: 
         return 1.0 if S > K and option_type == 'call' else (-1.0 if S < K and option_type == 'put' else 0.0)
     D1 = d1(S, K, T, r, sigma, q)
-    return math.exp(-q * T) * normal_cdf(D1) if option_type == 'call' else math.exp(-q * T) * (normal_cdf(D1) - 1)
+    return math.exp(-q * T) * ndtr(D1) if option_type == 'call' else math.exp(-q * T) * (ndtr(D1) - 1)
 
-def get_options_data(ticker, expiration, underlying_price):
-    try:
-        stock = yf.Ticker(ticker)
-        opt_chain = stock.option_chain(expiration)
-    except Exception as e:
-        return [], []
+def bs_greeks(S, strikes, T, r, ivs, option_type='call', q=0.0):
+    """Vega and delta arrays for whole arrays of strikes and IVs in one vectorized pass (T > 0)"""
+    # Everything that depends only on S, T, r and q is computed once per expiration, not per strike
+    sqrtT = math.sqrt(T)
+    disc = math.exp(-q * T)
+    drift = (r - q) * T
+    vega_scale = S * disc * sqrtT / 100 * _INV_SQRT_2PI
+    vol_sqrtT = ivs * sqrtT
+    with np.errstate(divide='ignore', invalid='ignore'):
+        D1 = (np.log(S / strikes) + drift + 0.5 * vol_sqrtT * vol_sqrtT) / vol_sqrtT
+    D1 = np.where(ivs <= 0, np.where(S > strikes, np.inf, -np.inf), D1)
+    vega = np.where(ivs <= 0, 0.0, vega_scale * np.exp(-0.5 * D1 * D1))
+    cdf = ndtr(D1)
+    delta = disc * cdf if option_type == 'call' else disc * (cdf - 1)
+    return vega, delta
 
-    def process_options(options_data):
-        if not options_data or len(options_data) == 0:
-            return []
-        
-        valid_options = []
-        for _, option in options_data.iterrows():
-            try:
-                # Check if required fields exist and are valid
-                if (pd.isna(option.get('impliedVolatility')) or 
-                    pd.isna(option.get('bid')) or 
-                    pd.isna(option.get('ask')) or
-                    option.get('impliedVolatility', 0) <= 0.01 or
-                    option.get('bid', 0) <= 0):
-                    continue
-                
-                # Check volume or open interest
-                volume = option.get('volume', 0)
-                open_interest = option.get('openInterest', 0)
-                if volume <= 0 and open_interest <= 0:
-                    continue
-                
-                # Check bid-ask spread
-                bid = option.get('bid', 0)
-                ask = option.get('ask', 0)
-                if ask <= 0 or (ask - bid) / ask >= 0.6:
-                    continue
-                
-                valid_options.append({
-                    'strike': option.get('strike', 0),
-                    'bid': bid,
-                    'ask': ask,
-                    'impliedVolatility': option.get('impliedVolatility', 0),
-                    'volume': volume,
-                    'openInterest': open_interest
-                })
-            except:
-                continue
-        
-        return valid_options
+def attach_greeks(options, underlying_price, T, risk_free_rate, option_type):
+    """Compute vega/delta for a list of option dicts at once and store them on each dict"""
+    if not options:
+        return
+    strikes = np.fromiter((o['strike'] for o in options), float, len(options))
+    ivs = np.fromiter((o['impliedVolatility'] for o in options), float, len(options))
+    vega, delta = bs_greeks(underlying_price, strikes, T, risk_free_rate, ivs, option_type)
+    for option, v, d in zip(options, vega.tolist(), delta.tolist()):
+        option['vega'] = v
+        option['delta'] = d
 
-    calls = process_options(opt_chain.calls)
-    puts = process_options(opt_chain.puts)
-    
-    time.sleep(0.2)  # Be respectful to API
-    return calls, puts
+# Structure-of-arrays view of a list of option dicts, used by the pair enumeration
+OptionArrays = namedtuple('OptionArrays', ['strike', 'bid', 'ask', 'delta', 'vega'])
 
-def analyze_bullish_risk_reversal(calls, puts, underlying_price, expiration_date, risk_free_rate=0.045):
-    today = datetime.now().date()
-    exp_date = datetime.strptime(expiration_date, "%Y-%m-%d").date()
-    T = max((exp_date - today).days / 365.0, 1 / (365 * 24))
-    days_to_exp = (exp_date - today).days
+def option_arrays(options):
+    n = len(options)
+    return OptionArrays(*(np.fromiter((o[key] for o in options), float, n) for key in OptionArrays._fields))
 
-    # Calculate Greeks for each option
-    for call in calls:
-        call['vega'] = bs_vega(underlying_price, call['strike'], T, risk_free_rate, call['impliedVolatility'])
-        call['delta'] = bs_delta(underlying_price, call['strike'], T, risk_free_rate, call['impliedVolatility'], 'call')
-    
-    for put in puts:
-        put['vega'] = bs_vega(underlying_price, put['strike'], T, risk_free_rate, put['impliedVolatility'])
-        put['delta'] = bs_delta(underlying_price, put['strike'], T, risk_free_rate, put['impliedVolatility'], 'put')
+def pair_columns(columns, **constants):
+    """Combination columns for one expiration; constant fields are broadcast so batches can be concatenated"""
+    n = len(next(iter(columns.values())))
+    for name, value in constants.items():
+        columns[name] = np.full(n, value, dtype=object if isinstance(value, str) else None)
+    return columns
 
-    # Filter OTM options
-    otm_calls = [c for c in calls if c['strike'] > underlying_price]
-    otm_puts = [p for p in puts if p['strike'] < underlying_price]
+def concat_columns(batches):
+    """Stack per-expiration combination columns into one set of columns"""
+    return {name: np.concatenate([batch[name] for batch in batches]) for name in batches[0]}
 
-    max_strike_distance = underlying_price * 0.75
-    otm_calls = [c for c in otm_calls if c['strike'] < underlying_price + max_strike_distance]
-    otm_puts = [p for p in otm_puts if p['strike'] > underlying_price - max_strike_distance]
+def records_from_arrays(columns, index=None):
+    """Materialize rows of the combination columns as dicts, optionally only those at the given indices"""
+    names = list(columns)
+    values = columns.values() if index is None else (column[index] for column in columns.values())
+    return [dict(zip(names, row)) for row in zip(*(column.tolist() for column in values))]
 
-    if not otm_calls or not otm_puts:
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _is_valid_pair(long_strike, long_ask, long_delta, long_vega,
+                       short_strike, short_bid, short_delta, short_vega, bullish):
+        if abs(long_ask - short_bid) > 20:
+            return False
+        net_delta = long_delta - short_delta
+        net_vega = long_vega - short_vega
+        if bullish:
+            return long_strike > short_strike and net_delta > 0.1 and net_vega > 0
+        return short_strike > long_strike and net_delta < -0.1 and net_vega <= 0.01
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _valid_pairs_njit(long_strike, long_ask, long_delta, long_vega,
+                          short_strike, short_bid, short_delta, short_vega, bullish):
+        """Row-major (long, short) index pairs passing the filters; count pass then fill pass, both parallel"""
+        n, m = long_strike.shape[0], short_strike.shape[0]
+        counts = np.zeros(n, dtype=np.int64)
+        for i in prange(n):
+            c = 0
+            for j in range(m):
+                if _is_valid_pair(long_strike[i], long_ask[i], long_delta[i], long_vega[i],
+                                  short_strike[j], short_bid[j], short_delta[j], short_vega[j], bullish):
+                    c += 1
+            counts[i] = c
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(counts)
+        long_idx = np.empty(offsets[n], dtype=np.int64)
+        short_idx = np.empty(offsets[n], dtype=np.int64)
+        for i in prange(n):
+            k = offsets[i]
+            for j in range(m):
+                if _is_valid_pair(long_strike[i], long_ask[i], long_delta[i], long_vega[i],
+                                  short_strike[j], short_bid[j], short_delta[j], short_vega[j], bullish):
+                    long_idx[k] = i
+                    short_idx[k] = j
+                    k += 1
+        return long_idx, short_idx
+else:
+    _valid_pairs_njit = None
+
+def valid_pairs(long, short, bullish):
+    """Indices (into long, short) of every risk-reversal pair passing the strike, cost, delta and vega filters"""
+    if _valid_pairs_njit is not None:
+        return _valid_pairs_njit(long.strike, long.ask, long.delta, long.vega,
+                                 short.strike, short.bid, short.delta, short.vega, bullish)
+    # |long ask - short bid| <= 20 only holds for short legs whose bid lies in [ask - 20, ask + 20], so
+    # sort the short bids once and binary-search each long leg's window instead of scanning every pair
+    order = np.argsort(short.bid, kind='stable')
+    sorted_bid = short.bid[order]
+    lo = np.searchsorted(sorted_bid, long.ask - 20 - 1e-9, side='left')
+    hi = np.searchsorted(sorted_bid, long.ask + 20 + 1e-9, side='right')
+    counts = hi - lo
+    long_idx = np.repeat(np.arange(len(long.ask)), counts)
+    within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    short_idx = order[np.repeat(lo, counts) + within]
+
+    # Exact filters on the surviving candidates only
+    net_delta = long.delta[long_idx] - short.delta[short_idx]
+    net_vega = long.vega[long_idx] - short.vega[short_idx]
+    mask = np.abs(long.ask[long_idx] - short.bid[short_idx]) <= 20
+    if bullish:
+        mask &= (long.strike[long_idx] > short.strike[short_idx]) & (net_delta > 0.1) & (net_vega > 0)
+    else:
+        mask &= (short.strike[short_idx] > long.strike[long_idx]) & (net_delta < -0.1) & (net_vega <= 0.01)
+    long_idx, short_idx = long_idx[mask], short_idx[mask]
+
+    # Restore row-major (long, short) order so ranking ties resolve as before
+    row_major = np.lexsort((short_idx, long_idx))
+    return long_idx[row_major], short_idx[row_major]
+
+# Short-lived caches so back-to-back bullish/bearish requests for a ticker reuse Yahoo responses
+_chain_cache = TTLCache(maxsize=256, ttl=60)
+_chain_cache_lock = threading.Lock()
+_quote_cache = TTLCache(maxsize=256, ttl=30)
+
+_YAHOO_OPTIONS_URL = "https://query1.finance.yahoo.com/v7/finance/options/{ticker}"
+_raw_chain_available = True
+# Yahoo answers these when it wants a session crumb; that won't change for this process, unlike 429/5xx blips
+_CRUMB_REQUIRED_STATUS = (401, 403)
+
+# Async chain requests share a token bucket instead of sleeping between calls
+_async_limiter = AsyncLimiter(5, 1)
+
+def _chain_params(expiration):
+    return {'date': calendar.timegm(_parse_exp(expiration).timetuple())}
+
+def _parse_chain_json(content):
+    """Calls and puts as lists of dicts straight from Yahoo's options JSON, without building DataFrames"""
+    options = orjson.loads(content)['optionChain']['result'][0]['options'][0]
+    return options.get('calls', []), options.get('puts', [])
+
+async def _fetch_chain_async(client, ticker, expiration):
+    """Raw chain fetch on the async client; falls back to the threaded yfinance fetch on failure.
+    The raw endpoint is tried once per chain, inside the limiter, and never retried after a 429/5xx"""
+    global _raw_chain_available
+    key = hashkey(ticker, expiration)
+    with _chain_cache_lock:
+        chain = _chain_cache.get(key)
+    if chain is not None:
+        return chain
+    if _raw_chain_available:
+        try:
+            async with _async_limiter:
+                resp = await client.get(_YAHOO_OPTIONS_URL.format(ticker=ticker), params=_chain_params(expiration))
+            resp.raise_for_status()
+            chain = _parse_chain_json(resp.content)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in _CRUMB_REQUIRED_STATUS:
+                _raw_chain_available = False
+        except (httpx.HTTPError, ValueError, KeyError, IndexError):
+            pass
+    if chain is None:
+        return await asyncio.to_thread(_fetch_chain_yf, ticker, expiration)
+    with _chain_cache_lock:
+        _chain_cache[key] = chain
+    return chain
+
+@cached(_chain_cache, lock=_chain_cache_lock)
+def _fetch_chain_yf(ticker, expiration):
+    opt_chain = yf.Ticker(ticker).option_chain(expiration)
+    return opt_chain.calls.to_dict('records'), opt_chain.puts.to_dict('records')
+
+@cached(_quote_cache, lock=threading.Lock())
+def _fetch_price_and_expirations(ticker):
+    """Last close and listed expirations; price is None when Yahoo has no history"""
+    stock = yf.Ticker(ticker)
+    history_data = stock.history(period='1d')
+    if history_data.empty:
+        return None, ()
+    try:
+        expirations = stock.options
+    except Exception:
+        expirations = ()
+    return history_data['Close'].iloc[-1], expirations
+
+_OPTION_FIELDS = ('strike', 'bid', 'ask', 'impliedVolatility', 'volume', 'openInterest')
+
+def process_options(options_data):
+    if not options_data:
         return []
 
-    combinations = []
-    for call in otm_calls:
-        for put in otm_puts:
-            if call['strike'] <= put['strike']:
-                continue
-            
-            net_cost = call['ask'] - put['bid']
-            strike_diff = call['strike'] - put['strike']
-            efficiency = -net_cost / strike_diff if strike_diff > 0 else 0
-            
-            if abs(net_cost) > 20:
-                continue
-            
-            net_delta = call['delta'] - put['delta']
-            net_vega = call['vega'] - put['vega']
-            
-            if net_delta <= 0.1 or net_vega <= 0:
-                continue
-            
-            combinations.append({
-                'long_call_strike': call['strike'],
-                'short_put_strike': put['strike'],
-                'net_cost': net_cost,
-                'net_delta': net_delta,
-                'net_vega': net_vega,
-                'efficiency': efficiency,
-                'breakeven': call['strike'] + net_cost,
-                'expiration': expiration_date,
-                'days_to_exp': days_to_exp
-            })
-    
-    return combinations
+    # One float column per field (missing/None -> NaN), then a single vectorized validity mask
+    cols = {key: np.array([o.get(key) for o in options_data], dtype=float) for key in _OPTION_FIELDS}
+    for key in ('strike', 'volume', 'openInterest'):
+        cols[key] = np.nan_to_num(cols[key])
+    iv, bid, ask = cols['impliedVolatility'], cols['bid'], cols['ask']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mask = ((iv > 0.01) & (bid > 0) & (ask > 0) &
+                ((cols['volume'] > 0) | (cols['openInterest'] > 0)) &
+                ((ask - bid) / ask < 0.6))
+    idx = np.nonzero(mask)[0]
+    return records_from_arrays({key: values[idx] for key, values in cols.items()})
 
-def analyze_bearish_risk_reversal(calls, puts, underlying_price, expiration_date, risk_free_rate=0.045):
+async def get_options_data_async(client, ticker, expiration, underlying_price):
+    try:
+        raw_calls, raw_puts = await _fetch_chain_async(client, ticker, expiration)
+    except Exception:
+        return [], []
+    return process_options(raw_calls), process_options(raw_puts)
+
+def _analyze_risk_reversal(calls, puts, underlying_price, expiration_date, direction, risk_free_rate=0.045):
+    """
+    Shared risk-reversal kernel. direction=+1 is long call / short put (bullish),
+    direction=-1 is long put / short call (bearish).
+    """
     today = datetime.now().date()
-    exp_date = datetime.strptime(expiration_date, "%Y-%m-%d").date()
+    exp_date = _parse_exp(expiration_date).date()
     T = max((exp_date - today).days / 365.0, 1 / (365 * 24))
     days_to_exp = (exp_date - today).days
 
-    # Calculate Greeks for each option
-    for call in calls:
-        call['vega'] = bs_vega(underlying_price, call['strike'], T, risk_free_rate, call['impliedVolatility'])
-        call['delta'] = bs_delta(underlying_price, call['strike'], T, risk_free_rate, call['impliedVolatility'], 'call')
-    
-    for put in puts:
-        put['vega'] = bs_vega(underlying_price, put['strike'], T, risk_free_rate, put['impliedVolatility'])
-        put['delta'] = bs_delta(underlying_price, put['strike'], T, risk_free_rate, put['impliedVolatility'], 'put')
-
-    # Filter OTM options
-    otm_calls = [c for c in calls if c['strike'] > underlying_price]
-    otm_puts = [p for p in puts if p['strike'] < underlying_price]
-
+    # Filter OTM options first; the filter only needs strikes, so ITM legs never get Greeks
     max_strike_distance = underlying_price * 0.75
-    otm_calls = [c for c in otm_calls if c['strike'] < underlying_price + max_strike_distance]
-    otm_puts = [p for p in otm_puts if p['strike'] > underlying_price - max_strike_distance]
+    otm_calls = [c for c in calls if underlying_price < c['strike'] < underlying_price + max_strike_distance]
+    otm_puts = [p for p in puts if underlying_price - max_strike_distance < p['strike'] < underlying_price]
 
     if not otm_calls or not otm_puts:
-        return []
+        return None
 
-    combinations = []
-    for put in otm_puts:
-        for call in otm_calls:
-            if put['strike'] >= call['strike']:
-                continue
-            
-            net_cost = put['ask'] - call['bid']
-            strike_diff = call['strike'] - put['strike']
-            efficiency = -net_cost / strike_diff if strike_diff > 0 else 0
-            
-            if abs(net_cost) > 20:
-                continue
-            
-            net_delta = put['delta'] - call['delta']
-            net_vega = put['vega'] - call['vega']
-            
-            if net_delta >= -0.1 or net_vega > 0.01:
-                continue
-            
-            combinations.append({
-                'long_put_strike': put['strike'],
-                'short_call_strike': call['strike'],
-                'net_cost': net_cost,
-                'net_delta': net_delta,
-                'net_vega': net_vega,
-                'efficiency': efficiency,
-                'breakeven': put['strike'] - net_cost,
-                'expiration': expiration_date,
-                'days_to_exp': days_to_exp
-            })
-    
-    return combinations
+    # Calculate Greeks for the remaining legs in one vectorized pass
+    attach_greeks(otm_calls, underlying_price, T, risk_free_rate, 'call')
+    attach_greeks(otm_puts, underlying_price, T, risk_free_rate, 'put')
 
-def rank_combinations(combinations):
-    if not combinations:
+    call = option_arrays(otm_calls)
+    put = option_arrays(otm_puts)
+    if direction > 0:
+        long, short, long_name, short_name = call, put, 'long_call_strike', 'short_put_strike'
+    else:
+        long, short, long_name, short_name = put, call, 'long_put_strike', 'short_call_strike'
+
+    li, sj = valid_pairs(long, short, bullish=direction > 0)
+    net_cost = long.ask[li] - short.bid[sj]
+
+    return pair_columns({
+        long_name: long.strike[li],
+        short_name: short.strike[sj],
+        'net_cost': net_cost,
+        'net_delta': long.delta[li] - short.delta[sj],
+        'net_vega': long.vega[li] - short.vega[sj],
+        'efficiency': -net_cost / (direction * (long.strike[li] - short.strike[sj])),
+        'breakeven': long.strike[li] + direction * net_cost,
+    }, expiration=expiration_date, days_to_exp=days_to_exp)
+
+def analyze_bullish_risk_reversal(calls, puts, underlying_price, expiration_date, risk_free_rate=0.045):
+    return _analyze_risk_reversal(calls, puts, underlying_price, expiration_date, +1, risk_free_rate)
+
+def analyze_bearish_risk_reversal(calls, puts, underlying_price, expiration_date, risk_free_rate=0.045):
+    return _analyze_risk_reversal(calls, puts, underlying_price, expiration_date, -1, risk_free_rate)
+
+def rank_combinations(columns, top=5):
+    """Best `top` combinations as dicts; only those rows are ever materialized"""
+    if not columns or not len(columns['efficiency']):
         return []
     
     # Simple ranking based on efficiency and delta
-    def score(combo):
-        return combo['efficiency'] * 0.6 + (combo['net_delta'] / 10) * 0.4
+    score = columns['efficiency'] * 0.6 + (columns['net_delta'] / 10) * 0.4
     
-    return sorted(combinations, key=score, reverse=True)
+    neg = -score
+    if len(neg) > top:
+        # O(N) selection of the top scores; every row tied with the cut-off is kept so the final order
+        # (and which tied row makes the cut) matches a full sort
+        cutoff = neg[np.argpartition(neg, top - 1)[:top]].max()
+        candidates = np.flatnonzero(neg <= cutoff)
+    else:
+        candidates = np.arange(len(neg))
+    
+    # Stable sort on the negated score keeps ties in enumeration order, like sorted(..., reverse=True)
+    order = candidates[np.argsort(neg[candidates], kind='stable')][:top]
+    return records_from_arrays(columns, order)
 
-def format_analysis_result(combinations, ticker, strategy_type):
-    if not combinations:
+def build_analysis_data(combinations, ticker, strategy_type):
+    """Structured result with no string formatting: the best combination and the top 5 as plain dicts"""
+    return {
+        "ticker": ticker,
+        "strategy_type": strategy_type,
+        "best": combinations[0] if combinations else None,
+        "top_5": [dict(combo, rank=i + 1) for i, combo in enumerate(combinations[:5])],
+    }
+
+def render_analysis_result(data):
+    """Render structured analysis data into the summary/risk/top_5 text fields the UI displays"""
+    ticker, strategy_type, best = data["ticker"], data["strategy_type"], data["best"]
+    if best is None:
         return {
             "summary": f"No valid {strategy_type.lower()} strategies found for {ticker}.",
             "risk": "",
@@ -223,7 +356,6 @@ def format_analysis_result(combinations, ticker, strategy_type):
             "top_5": []
         }
     
-    best = combinations[0]
     cost_display = f"${abs(best['net_cost']):.2f} {'CREDIT' if best['net_cost'] < 0 else 'DEBIT'}"
     
     summary = f"""
@@ -254,7 +386,7 @@ The primary risk is the short {'put' if strategy_type == 'Bullish' else 'call'}.
     
     # Create top 5 table
     top_5 = []
-    for i, combo in enumerate(combinations[:5]):
+    for combo in data["top_5"]:
         if strategy_type == "Bullish":
             strikes = f"${combo['long_call_strike']:.2f}/{combo['short_put_strike']:.2f}"
         else:
@@ -262,7 +394,7 @@ The primary risk is the short {'put' if strategy_type == 'Bullish' else 'call'}.
         
         cost_txt = f"${abs(combo['net_cost']):.2f} {'CR' if combo['net_cost'] < 0 else 'DB'}"
         top_5.append([
-            str(i+1),
+            str(combo['rank']),
             combo['expiration'],
             strikes,
             cost_txt,
@@ -278,51 +410,45 @@ The primary risk is the short {'put' if strategy_type == 'Bullish' else 'call'}.
         "top_5": top_5
     }
 
-def run_bullish_analysis(ticker: str, min_dte: int, max_dte: int) -> dict:
+def format_analysis_result(combinations, ticker, strategy_type):
+    return render_analysis_result(build_analysis_data(combinations, ticker, strategy_type))
+
+async def _run_analysis_async(ticker, min_dte, max_dte, analyze, strategy_type):
     try:
-        # Get stock data
-        stock = yf.Ticker(ticker)
-        history_data = stock.history(period='1d')
+        # Get stock data and available options (cached briefly per ticker)
+        underlying_price, expirations = await asyncio.to_thread(_fetch_price_and_expirations, ticker)
         
-        if history_data.empty:
-            return format_analysis_result([], ticker, "Bullish")
-        
-        underlying_price = history_data['Close'].iloc[-1]
-        time.sleep(0.4)
+        if underlying_price is None or not expirations:
+            return format_analysis_result([], ticker, strategy_type)
         
         today = datetime.now()
-        
-        # Get available options
-        try:
-            expirations = stock.options
-            if not expirations:
-                return format_analysis_result([], ticker, "Bullish")
-        except Exception:
-            return format_analysis_result([], ticker, "Bullish")
-
-        valid_expirations = [exp for exp in expirations if min_dte <= (datetime.strptime(exp, "%Y-%m-%d") - today).days <= max_dte]
-        time.sleep(0.4)
+
+        valid_expirations = [exp for exp in expirations if min_dte <= (_parse_exp(exp) - today).days <= max_dte]
         
         if not valid_expirations:
-            return format_analysis_result([], ticker, "Bullish")
+            return format_analysis_result([], ticker, strategy_type)
         
         exp_to_analyze = valid_expirations[:3]
-        all_combinations = []
+        batches = []
         
-        for expiration in exp_to_analyze:
-            time.sleep(0.4)
-            calls, puts = get_options_data(ticker, expiration, underlying_price)
+        # Fetch the option chains concurrently on one async client; the limiter bounds the request rate
+        async with httpx.AsyncClient(headers={'User-Agent': 'Mozilla/5.0'}, timeout=10) as client:
+            chains = await asyncio.gather(*(get_options_data_async(client, ticker, exp, underlying_price)
+                                            for exp in exp_to_analyze))
+
+        for expiration, (calls, puts) in zip(exp_to_analyze, chains):
             if not calls or not puts:
                 continue
            
-            combinations = analyze_bullish_risk_reversal(calls, puts, underlying_price, expiration)
-            all_combinations.extend(combinations)
+            combinations = analyze(calls, puts, underlying_price, expiration)
+            if combinations is not None:
+                batches.append(combinations)
         
-        if not all_combinations:
-            return format_analysis_result([], ticker, "Bullish")
+        if not batches:
+            return format_analysis_result([], ticker, strategy_type)
         
-        ranked_results = rank_combinations(all_combinations)
-        return format_analysis_result(ranked_results, ticker, "Bullish")
+        ranked_results = rank_combinations(concat_columns(batches))
+        return format_analysis_result(ranked_results, ticker, strategy_type)
         
     except Exception as e:
         return {
@@ -332,56 +458,15 @@ def run_bullish_analysis(ticker: str, min_dte: int, max_dte: int) -> dict:
             "top_5": []
         }
 
+async def run_bullish_analysis_async(ticker: str, min_dte: int, max_dte: int) -> dict:
+    return await _run_analysis_async(ticker, min_dte, max_dte, analyze_bullish_risk_reversal, "Bullish")
+
+async def run_bearish_analysis_async(ticker: str, min_dte: int, max_dte: int) -> dict:
+    return await _run_analysis_async(ticker, min_dte, max_dte, analyze_bearish_risk_reversal, "Bearish")
+
+# Synchronous entry points for the http.server handlers
+def run_bullish_analysis(ticker: str, min_dte: int, max_dte: int) -> dict:
+    return asyncio.run(run_bullish_analysis_async(ticker, min_dte, max_dte))
+
 def run_bearish_analysis(ticker: str, min_dte: int, max_dte: int) -> dict:
-    try:
-        # Get stock data
-        stock = yf.Ticker(ticker)
-        history_data = stock.history(period='1d')
-        
-        if history_data.empty:
-            return format_analysis_result([], ticker, "Bearish")
-        
-        underlying_price = history_data['Close'].iloc[-1]
-        time.sleep(0.4)
-        
-        today = datetime.now()
-        
-        # Get available options
-        try:
-            expirations = stock.options
-            if not expirations:
-                return format_analysis_result([], ticker, "Bearish")
-        except Exception:
-            return format_analysis_result([], ticker, "Bearish")
-
-        valid_expirations = [exp for exp in expirations if min_dte <= (datetime.strptime(exp, "%Y-%m-%d") - today).days <= max_dte]
-        time.sleep(0.4)
-        
-        if not valid_expirations:
-            return format_analysis_result([], ticker, "Bearish")
-        
-        exp_to_analyze = valid_expirations[:3]
-        all_combinations = []
-        
-        for expiration in exp_to_analyze:
-            time.sleep(0.4)
-            calls, puts = get_options_data(ticker, expiration, underlying_price)
-            if not calls or not puts:
-                continue
-           
-            combinations = analyze_bearish_risk_reversal(calls, puts, underlying_price, expiration)
-            all_combinations.extend(combinations)
-        
-        if not all_combinations:
-            return format_analysis_result([], ticker, "Bearish")
-        
-        ranked_results = rank_combinations(all_combinations)
-        return format_analysis_result(ranked_results, ticker, "Bearish")
-        
-    except Exception as e:
-        return {
-            "summary": f"Analysis Error: {str(e)}",
-            "risk": "",
-            "pricing_comparison": "",
-            "top_5": []
-        }
+    return asyncio.run(run_bearish_analysis_async(ticker, min_dte, max_dte))
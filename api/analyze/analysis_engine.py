@@ -2,11 +2,21 @@ import yfinance as yf
 import pandas as pd
 import numpy as np
 from scipy.stats import norm
+from collections import deque, namedtuple
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import warnings
 import logging
+import math
 import time
 import os
+import threading
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy greeks below are used instead
+    njit = None
 
 # Configure basic logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -18,8 +28,10 @@ warnings.filterwarnings('ignore')
 # Black-Scholes and Data Functions
 # -------------------------------
 def d1(S, K, T, r, sigma, q=0.0):
-    if T <= 0 or sigma <= 0: return np.inf if S > K else -np.inf
-    return (np.log(S / K) + (r - q + 0.5 * sigma ** 2) * T) / (sigma * np.sqrt(T))
+    S, K, sigma = np.asarray(S, dtype=float), np.asarray(K, dtype=float), np.asarray(sigma, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        D1 = (np.log(S / K) + (r - q + 0.5 * sigma ** 2) * T) / (sigma * np.sqrt(T))
+    return np.where((T <= 0) | (sigma <= 0), np.where(S > K, np.inf, -np.inf), D1)[()]
 
 
 def d2(S, K, T, r, sigma, q=0.0):
@@ -27,23 +39,172 @@ def d2(S, K, T, r, sigma, q=0.0):
 
 
 def bs_vega(S, K, T, r, sigma, q=0.0):
-    if T <= 0 or sigma <= 0: return 0
+    sigma = np.asarray(sigma, dtype=float)
     D1 = d1(S, K, T, r, sigma, q)
-    return S * np.exp(-q * T) * norm.pdf(D1) * np.sqrt(T) / 100
+    with np.errstate(invalid='ignore'):
+        vega = S * np.exp(-q * T) * norm.pdf(D1) * np.sqrt(T) / 100
+    return np.where((T <= 0) | (sigma <= 0), 0.0, vega)[()]
 
 
 def bs_delta(S, K, T, r, sigma, option_type='call', q=0.0):
-    if T <= 0: return 1.0 if S > K and option_type == 'call' else (-1.0 if S < K and option_type == 'put' else 0.0)
+    if T <= 0:
+        K = np.asarray(K, dtype=float)
+        return np.where(S > K, 1.0, 0.0)[()] if option_type == 'call' else np.where(S < K, -1.0, 0.0)[()]
     D1 = d1(S, K, T, r, sigma, q)
     return np.exp(-q * T) * norm.cdf(D1) if option_type == 'call' else np.exp(-q * T) * (norm.cdf(D1) - 1)
 
 
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _greeks_njit(S, K_arr, T, r, sigma_arr, q, is_call):
+        """Vega and delta for a chain of strikes in one compiled loop (norm.cdf via math.erf)."""
+        n = K_arr.shape[0]
+        vega = np.empty(n)
+        delta = np.empty(n)
+        sqrtT = math.sqrt(T) if T > 0 else 0.0
+        disc = math.exp(-q * T)
+        for i in range(n):
+            K = K_arr[i]
+            sigma = sigma_arr[i]
+            if T <= 0:
+                vega[i] = 0.0
+                if is_call:
+                    delta[i] = 1.0 if S > K else 0.0
+                else:
+                    delta[i] = -1.0 if S < K else 0.0
+            elif sigma <= 0:
+                vega[i] = 0.0
+                cdf = 1.0 if S > K else 0.0
+                delta[i] = disc * cdf if is_call else disc * (cdf - 1.0)
+            else:
+                D1 = (math.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / (sigma * sqrtT)
+                pdf = math.exp(-0.5 * D1 * D1) / math.sqrt(2.0 * math.pi)
+                cdf = 0.5 * (1.0 + math.erf(D1 / math.sqrt(2.0)))
+                vega[i] = S * disc * pdf * sqrtT / 100
+                delta[i] = disc * cdf if is_call else disc * (cdf - 1.0)
+        return vega, delta
+else:
+    _greeks_njit = None
+
+
+def bs_greeks(S, K, T, r, sigma, option_type='call', q=0.0):
+    """Return (vega, delta) arrays for arrays of strikes and implied volatilities."""
+    if _greeks_njit is not None:
+        return _greeks_njit(float(S), np.ascontiguousarray(K, dtype=np.float64), float(T), float(r),
+                            np.ascontiguousarray(sigma, dtype=np.float64), float(q), option_type == 'call')
+    K, sigma = np.asarray(K, dtype=float), np.asarray(sigma, dtype=float)
+    if T <= 0:
+        return np.zeros_like(K), bs_delta(S, K, T, r, sigma, option_type, q)
+
+    # d1, its pdf/cdf and the discount factor are shared by vega and delta
+    sqrtT = np.sqrt(T)
+    vol_sqrtT = sigma * sqrtT
+    with np.errstate(divide='ignore', invalid='ignore'):
+        D1 = (np.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / vol_sqrtT
+    D1 = np.where(sigma <= 0, np.where(S > K, np.inf, -np.inf), D1)
+    disc = np.exp(-q * T)
+    cdfD1 = norm.cdf(D1)
+    vega = np.where(sigma <= 0, 0.0, S * disc * norm.pdf(D1) * sqrtT / 100)
+    delta = disc * cdfD1 if option_type == 'call' else disc * (cdfD1 - 1)
+    return vega, delta
+
+
+def warm_up():
+    """Compile (or load from the on-disk cache) the JIT greeks kernel before the first real request."""
+    strikes = np.array([90.0, 110.0])
+    ivs = np.array([0.3, 0.3])
+    bs_greeks(100.0, strikes, 0.1, 0.045, ivs, 'call')
+    bs_greeks(100.0, strikes, 0.1, 0.045, ivs, 'put')
+
+
+# -------------------------------
+# Market Data Cache
+# -------------------------------
+# Bullish and bearish runs on the same ticker are usually issued back to back,
+# so Yahoo responses are reused for a short window instead of refetched.
+# TTLCache evicts expired and least-recently-used entries, so long-running servers stay bounded.
+CACHE_TTL_SECONDS = 60
+_PRICE_CACHE = TTLCache(maxsize=256, ttl=CACHE_TTL_SECONDS)         # ticker -> price
+_EXPIRATIONS_CACHE = TTLCache(maxsize=256, ttl=CACHE_TTL_SECONDS)   # ticker -> expirations
+_CHAIN_CACHE = TTLCache(maxsize=1024, ttl=CACHE_TTL_SECONDS)        # (ticker, expiration) -> (raw_calls, raw_puts)
+_CACHE_LOCK = threading.Lock()  # chains are fetched from a thread pool
+
+
+def _cache_get(cache, key):
+    with _CACHE_LOCK:
+        return cache.get(key)
+
+
+def _cache_put(cache, key, value):
+    with _CACHE_LOCK:
+        cache[key] = value
+
+
+class _RateLimiter:
+    """Sliding-window limiter: allows bursts, only waits once max_calls were made within period."""
+
+    def __init__(self, max_calls, period=1.0):
+        self.max_calls = max_calls
+        self.period = period
+        self._calls = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            while self._calls and now - self._calls[0] >= self.period:
+                self._calls.popleft()
+            if len(self._calls) >= self.max_calls:
+                time.sleep(self.period - (now - self._calls[0]))
+                self._calls.popleft()
+            self._calls.append(time.monotonic())
+
+
+# Shared across threads so concurrent chain fetches stay within Yahoo's budget
+_YAHOO_LIMITER = _RateLimiter(max_calls=5, period=1.0)
+
+
+def _get_underlying_price(ticker):
+    """Last close for ticker, or None if Yahoo has no price data."""
+    price = _cache_get(_PRICE_CACHE, ticker)
+    if price is None:
+        _YAHOO_LIMITER.acquire()
+        history_data = yf.Ticker(ticker).history(period='1d')
+        if history_data.empty:
+            return None
+        price = history_data['Close'].iloc[-1]
+        _cache_put(_PRICE_CACHE, ticker, price)
+    return price
+
+
+def _get_expirations(ticker):
+    expirations = _cache_get(_EXPIRATIONS_CACHE, ticker)
+    if expirations is None:
+        _YAHOO_LIMITER.acquire()
+        expirations = yf.Ticker(ticker).options
+        if expirations:
+            _cache_put(_EXPIRATIONS_CACHE, ticker, expirations)
+    return expirations
+
+
+def _expirations_in_range(expirations, today, min_dte, max_dte):
+    """Expirations whose days-to-expiry fall within [min_dte, max_dte], parsed in one vectorized pass."""
+    days = (pd.to_datetime(list(expirations), format="%Y-%m-%d") - pd.Timestamp(today)).days.to_numpy()
+    mask = (days >= min_dte) & (days <= max_dte)
+    return [exp for exp, keep in zip(expirations, mask) if keep]
+
+
 def get_options_data(ticker, expiration, underlying_price):
-    try:
-        stock = yf.Ticker(ticker)
-        opt_chain = stock.option_chain(expiration)
-    except Exception as e:
-        return pd.DataFrame(), pd.DataFrame()
+    raw_chain = _cache_get(_CHAIN_CACHE, (ticker, expiration))
+    if raw_chain is None:
+        try:
+            _YAHOO_LIMITER.acquire()
+            stock = yf.Ticker(ticker)
+            opt_chain = stock.option_chain(expiration)
+        except Exception as e:
+            return pd.DataFrame(), pd.DataFrame()
+        raw_chain = (opt_chain.calls, opt_chain.puts)
+        _cache_put(_CHAIN_CACHE, (ticker, expiration), raw_chain)
 
     def process_df(input_df):
         if input_df is None or input_df.empty: return pd.DataFrame()
@@ -58,173 +219,145 @@ def get_options_data(ticker, expiration, underlying_price):
             filtered_df['expiration'] = expiration
         return filtered_df
 
-    calls = process_df(opt_chain.calls)
-    puts = process_df(opt_chain.puts)
-
-    # Add a small delay to be respectful to the API
-    time.sleep(0.2)
-
+    calls = process_df(raw_chain[0])
+    puts = process_df(raw_chain[1])
     return calls, puts
 
 
 # -------------------------------
 # Smarter Strategy Engine
 # -------------------------------
-def analyze_bullish_risk_reversal(calls, puts, underlying_price, expiration_date, risk_free_rate=0.045,
-                                  dividend_yield=0.0):
-    today = pd.to_datetime(datetime.now().date())
-    exp_date = pd.to_datetime(expiration_date)
-    T = max((exp_date - today).days / 365.0, 1 / (365 * 24))
-    days_to_exp = (exp_date - today).days
-
-    for df, option_type in [(calls, 'call'), (puts, 'put')]:
-        if df.empty: continue
-        df['vega'] = df.apply(
-            lambda row: bs_vega(underlying_price, row['strike'], T, risk_free_rate, row['impliedVolatility'],
-                                dividend_yield), axis=1)
-        df['delta'] = df.apply(
-            lambda row: bs_delta(underlying_price, row['strike'], T, risk_free_rate, row['impliedVolatility'],
-                                 option_type, dividend_yield), axis=1)
-
-    otm_calls = calls[calls['strike'] > underlying_price].copy()
-    otm_puts = puts[puts['strike'] < underlying_price].copy()
+# Quote and greek columns for one side of the chain, as parallel NumPy arrays
+OptionLeg = namedtuple('OptionLeg', ['strike', 'bid', 'ask', 'iv', 'delta', 'vega'])
 
-    max_strike_distance = underlying_price * 0.75
-    otm_calls = otm_calls[otm_calls['strike'] < underlying_price + max_strike_distance]
-    otm_puts = otm_puts[otm_puts['strike'] > underlying_price - max_strike_distance]
-
-    if otm_calls.empty or otm_puts.empty:
-        return []
-
-    combinations = []
-    for _, call in otm_calls.iterrows():
-        for _, put in otm_puts.iterrows():
-            if call['strike'] <= put['strike']: continue
-            combo = create_bullish_strategy_combination(call, put)
-            if combo and is_valid_bullish_combo(combo):
-                combo.update({'strategy_type': 'Bullish Risk Reversal', 'expiration': expiration_date,
-                              'days_to_exp': days_to_exp})
-                combinations.append(combo)
-    return combinations
-
-
-def analyze_bearish_risk_reversal(calls, puts, underlying_price, expiration_date, risk_free_rate=0.045,
-                                  dividend_yield=0.0):
-    today = pd.to_datetime(datetime.now().date())
-    exp_date = pd.to_datetime(expiration_date)
-    T = max((exp_date - today).days / 365.0, 1 / (365 * 24))
-    days_to_exp = (exp_date - today).days
-
-    for df, option_type in [(calls, 'call'), (puts, 'put')]:
-        if df.empty: continue
-        df['vega'] = df.apply(
-            lambda row: bs_vega(underlying_price, row['strike'], T, risk_free_rate, row['impliedVolatility'],
-                                dividend_yield), axis=1)
-        df['delta'] = df.apply(
-            lambda row: bs_delta(underlying_price, row['strike'], T, risk_free_rate, row['impliedVolatility'],
-                                 option_type, dividend_yield), axis=1)
-
-    otm_calls = calls[calls['strike'] > underlying_price].copy()
-    otm_puts = puts[puts['strike'] < underlying_price].copy()
 
+def _otm_masks(calls, puts, underlying_price):
+    """Boolean masks selecting OTM calls and puts within 75% of the underlying price."""
     max_strike_distance = underlying_price * 0.75
-    otm_calls = otm_calls[otm_calls['strike'] < underlying_price + max_strike_distance]
-    otm_puts = otm_puts[otm_puts['strike'] > underlying_price - max_strike_distance]
-
-    if otm_calls.empty or otm_puts.empty:
-        return []
-
-    combinations = []
-    for _, put in otm_puts.iterrows():
-        for _, call in otm_calls.iterrows():
-            if put['strike'] >= call['strike']: continue
-            combo = create_bearish_strategy_combination(put, call)
-            if combo and is_valid_bearish_combo(combo):
-                combo.update({'strategy_type': 'Bearish Risk Reversal', 'expiration': expiration_date,
-                              'days_to_exp': days_to_exp})
-                combinations.append(combo)
-    return combinations
-
-
-def create_bullish_strategy_combination(call_row, put_row):
-    try:
-        net_cost = call_row['ask'] - put_row['bid']
-        strike_diff = call_row['strike'] - put_row['strike']
-        efficiency = -net_cost / strike_diff if strike_diff > 0 else 0
-        
-        return {
-            'long_call_strike': call_row['strike'], 'short_put_strike': put_row['strike'],
-            'net_cost': net_cost, 'iv_advantage': put_row['impliedVolatility'] - call_row['impliedVolatility'],
-            'net_delta': call_row['delta'] - put_row['delta'], 'net_vega': call_row['vega'] - put_row['vega'],
-            'max_loss_down': put_row['strike'] - (put_row['bid'] - call_row['ask']),
-            'breakeven': call_row['strike'] + net_cost,
-            'efficiency': efficiency
-        }
-    except (KeyError, TypeError):
-        return None
-
-
-def create_bearish_strategy_combination(put_row, call_row):
-    try:
-        net_cost = put_row['ask'] - call_row['bid']
-        strike_diff = call_row['strike'] - put_row['strike']
-        efficiency = -net_cost / strike_diff if strike_diff > 0 else 0
-        
-        return {
-            'long_put_strike': put_row['strike'], 'short_call_strike': call_row['strike'],
-            'net_cost': net_cost, 'iv_advantage': call_row['impliedVolatility'] - put_row['impliedVolatility'],
-            'net_delta': put_row['delta'] - call_row['delta'], 'net_vega': put_row['vega'] - call_row['vega'],
-            'max_loss_up': call_row['strike'] + (call_row['bid'] - put_row['ask']),
-            'breakeven': put_row['strike'] - net_cost,
-            'efficiency': efficiency
-        }
-    except (KeyError, TypeError):
-        return None
-
-
-def is_valid_bullish_combo(combo):
-    if not combo: return False
-    if abs(combo['net_cost']) > 20: return False
-    if combo['net_delta'] <= 0.1 or combo['net_vega'] <= 0: return False
-    return True
-
-
-def is_valid_bearish_combo(combo):
-    if not combo: return False
-    if abs(combo['net_cost']) > 20: return False
-    if combo['net_delta'] >= -0.1 or combo['net_vega'] > 0.01: return False
-    return True
+    call_strikes = calls['strike'].to_numpy(dtype=float)
+    put_strikes = puts['strike'].to_numpy(dtype=float)
+    otm_calls = (call_strikes > underlying_price) & (call_strikes < underlying_price + max_strike_distance)
+    otm_puts = (put_strikes < underlying_price) & (put_strikes > underlying_price - max_strike_distance)
+    return otm_calls, otm_puts
+
+
+def _otm_leg(df, otm_mask, underlying_price, T, risk_free_rate, dividend_yield, option_type):
+    strike, bid, ask, iv = (df[col].to_numpy(dtype=float)[otm_mask]
+                            for col in ('strike', 'bid', 'ask', 'impliedVolatility'))
+    vega, delta = bs_greeks(underlying_price, strike, T, risk_free_rate, iv, option_type, dividend_yield)
+    return OptionLeg(strike, bid, ask, iv, delta, vega)
+
+
+def analyze_bullish_risk_reversal(calls, puts, underlying_price, expiration_date, exp_ts, today,
+                                  risk_free_rate=0.045, dividend_yield=0.0):
+    """exp_ts and today are pd.Timestamps parsed once by the caller."""
+    days_to_exp = (exp_ts - today).days
+    T = max(days_to_exp / 365.0, 1 / (365 * 24))
+
+    if calls.empty or puts.empty:
+        return pd.DataFrame()
+    otm_call_mask, otm_put_mask = _otm_masks(calls, puts, underlying_price)
+    if not otm_call_mask.any() or not otm_put_mask.any():
+        return pd.DataFrame()
+    call = _otm_leg(calls, otm_call_mask, underlying_price, T, risk_free_rate, dividend_yield, 'call')
+    put = _otm_leg(puts, otm_put_mask, underlying_price, T, risk_free_rate, dividend_yield, 'put')
+
+    # Cheap strike/cost predicates over every (call, put) pair: rows are calls, columns are puts
+    net_cost = call.ask[:, None] - put.bid[None, :]
+    ci, pj = np.nonzero((call.strike[:, None] > put.strike[None, :]) & (np.abs(net_cost) <= 20))
+    net_cost = net_cost[ci, pj]
+
+    # Greek predicates and derived fields are only evaluated for pairs that survived
+    net_delta = call.delta[ci] - put.delta[pj]
+    net_vega = call.vega[ci] - put.vega[pj]
+    keep = (net_delta > 0.1) & (net_vega > 0)
+    ci, pj, net_cost, net_delta, net_vega = ci[keep], pj[keep], net_cost[keep], net_delta[keep], net_vega[keep]
+    if len(ci) == 0:
+        return pd.DataFrame()
+    strike_diff = call.strike[ci] - put.strike[pj]
+
+    combos = pd.DataFrame({
+        'long_call_strike': call.strike[ci], 'short_put_strike': put.strike[pj],
+        'net_cost': net_cost, 'iv_advantage': put.iv[pj] - call.iv[ci],
+        'net_delta': net_delta, 'net_vega': net_vega,
+        'max_loss_down': put.strike[pj] - (put.bid[pj] - call.ask[ci]),
+        'breakeven': call.strike[ci] + net_cost,
+        'efficiency': -net_cost / strike_diff,
+        'strategy_type': 'Bullish Risk Reversal', 'expiration': expiration_date, 'days_to_exp': days_to_exp,
+    }, copy=False)
+    return combos
+
+
+def analyze_bearish_risk_reversal(calls, puts, underlying_price, expiration_date, exp_ts, today,
+                                  risk_free_rate=0.045, dividend_yield=0.0):
+    """exp_ts and today are pd.Timestamps parsed once by the caller."""
+    days_to_exp = (exp_ts - today).days
+    T = max(days_to_exp / 365.0, 1 / (365 * 24))
+
+    if calls.empty or puts.empty:
+        return pd.DataFrame()
+    otm_call_mask, otm_put_mask = _otm_masks(calls, puts, underlying_price)
+    if not otm_call_mask.any() or not otm_put_mask.any():
+        return pd.DataFrame()
+    call = _otm_leg(calls, otm_call_mask, underlying_price, T, risk_free_rate, dividend_yield, 'call')
+    put = _otm_leg(puts, otm_put_mask, underlying_price, T, risk_free_rate, dividend_yield, 'put')
+
+    # Cheap strike/cost predicates over every (put, call) pair: rows are puts, columns are calls
+    net_cost = put.ask[:, None] - call.bid[None, :]
+    pi, cj = np.nonzero((call.strike[None, :] > put.strike[:, None]) & (np.abs(net_cost) <= 20))
+    net_cost = net_cost[pi, cj]
+
+    # Greek predicates and derived fields are only evaluated for pairs that survived
+    net_delta = put.delta[pi] - call.delta[cj]
+    net_vega = put.vega[pi] - call.vega[cj]
+    keep = (net_delta < -0.1) & (net_vega <= 0.01)
+    pi, cj, net_cost, net_delta, net_vega = pi[keep], cj[keep], net_cost[keep], net_delta[keep], net_vega[keep]
+    if len(pi) == 0:
+        return pd.DataFrame()
+    strike_diff = call.strike[cj] - put.strike[pi]
+
+    combos = pd.DataFrame({
+        'long_put_strike': put.strike[pi], 'short_call_strike': call.strike[cj],
+        'net_cost': net_cost, 'iv_advantage': call.iv[cj] - put.iv[pi],
+        'net_delta': net_delta, 'net_vega': net_vega,
+        'max_loss_up': call.strike[cj] + (call.bid[cj] - put.ask[pi]),
+        'breakeven': put.strike[pi] - net_cost,
+        'efficiency': -net_cost / strike_diff,
+        'strategy_type': 'Bearish Risk Reversal', 'expiration': expiration_date, 'days_to_exp': days_to_exp,
+    }, copy=False)
+    return combos
+
+
+def _min_max_normalize(values, reverse=False):
+    """Scale a NumPy array to [0, 1] from one min/max pass; constant input maps to 0.5."""
+    lo, hi = values.min(), values.max()
+    if len(values) < 2 or hi == lo:
+        return np.full(len(values), 0.5)
+    scaled = (values - lo) / (hi - lo)
+    return 1 - scaled if reverse else scaled
 
 
 def rank_combinations(combinations):
+    """Score a list of per-expiration combination DataFrames and sort best first."""
     if not combinations: return []
-    df = pd.DataFrame(combinations)
+    df = pd.concat(combinations, ignore_index=True)
 
-    def safe_normalize(series, reverse=False):
-        if series.std() == 0 or len(series) < 2: return pd.Series([0.5] * len(series), index=series.index)
-        norm = (series - series.min()) / (series.max() - series.min())
-        return 1 - norm if reverse else norm
-
-    df['delta_score'] = safe_normalize(df['net_delta'])
-    df['vega_score'] = safe_normalize(df['net_vega'])
-    df['efficiency_score'] = safe_normalize(df['efficiency'])
+    df['delta_score'] = _min_max_normalize(df['net_delta'].to_numpy())
+    df['vega_score'] = _min_max_normalize(df['net_vega'].to_numpy())
+    df['efficiency_score'] = _min_max_normalize(df['efficiency'].to_numpy())
     df['total_score'] = (df['delta_score'] * 0.40 + df['efficiency_score'] * 0.40 + df['vega_score'] * 0.20)
     return df.sort_values('total_score', ascending=False)
 
 
 def rank_bearish_combinations(combinations):
+    """Score a list of per-expiration combination DataFrames and sort best first."""
     if not combinations: return []
-    df = pd.DataFrame(combinations)
-
-    def safe_normalize(series, reverse=False):
-        if series.std() == 0 or len(series) < 2: return pd.Series([0.5] * len(series), index=series.index)
-        norm = (series - series.min()) / (series.max() - series.min())
-        return 1 - norm if reverse else norm
+    df = pd.concat(combinations, ignore_index=True)
 
     # For bearish, we want negative delta (more negative is better), low absolute vega, and good efficiency
-    df['delta_score'] = safe_normalize(df['net_delta'], reverse=True)  # More negative delta is better
-    df['vega_score'] = safe_normalize(df['net_vega'].abs(), reverse=True)  # Lower absolute vega is better
-    df['efficiency_score'] = safe_normalize(df['efficiency'])
+    df['delta_score'] = _min_max_normalize(df['net_delta'].to_numpy(), reverse=True)  # More negative delta is better
+    df['vega_score'] = _min_max_normalize(np.abs(df['net_vega'].to_numpy()), reverse=True)  # Lower absolute vega is better
+    df['efficiency_score'] = _min_max_normalize(df['efficiency'].to_numpy())
     df['total_score'] = (df['delta_score'] * 0.40 + df['efficiency_score'] * 0.40 + df['vega_score'] * 0.20)
     return df.sort_values('total_score', ascending=False)
 
@@ -232,13 +365,52 @@ def rank_bearish_combinations(combinations):
 # -------------------------------
 # Text Report Formatting
 # -------------------------------
+def _trade_details(best, strategy_type):
+    """Expiration, strikes, cost and efficiency lines for the top recommended trade."""
+    cost_display = f"${abs(best['net_cost']):.2f} {'CREDIT' if best['net_cost'] < 0 else 'DEBIT'}"
+    if strategy_type == "Bullish":
+        strikes = f"Long Call: ${best['long_call_strike']:.2f}, Short Put: ${best['short_put_strike']:.2f}"
+    else:
+        strikes = f"Long Put: ${best['long_put_strike']:.2f}, Short Call: ${best['short_call_strike']:.2f}"
+    return f"""Expiration: {best['expiration']} ({best['days_to_exp']} days)
+Strikes: {strikes}
+Net Cost: {cost_display}
+Breakeven: ${best['breakeven']:.2f}
+Net Vega: {best['net_vega']:.3f}
+Efficiency: {best['efficiency']:.1%}
+"""
+
+
+def _risk_overview(best, strategy_type):
+    """Strategy overview and assignment risk paragraph for the top recommended trade."""
+    if strategy_type == "Bullish":
+        return f"""A Bullish Risk Reversal (Long OTM Call, Short OTM Put) creates a synthetic long stock position with low or zero cost. 
+The primary risk is the short put. If the stock price falls below ${best['short_put_strike']:.2f}, you may be assigned 
+100 shares per contract at that price. Maximum loss is up to ${best['max_loss_down']:.2f} per share if the stock goes to zero.
+"""
+    return f"""A Bearish Risk Reversal (Long OTM Put, Short OTM Call) creates a synthetic short stock position with low or zero cost. 
+The primary risk is the short call. If the stock price rises above ${best['short_call_strike']:.2f}, you may be assigned 
+100 shares per contract at that price. Maximum loss is unlimited if the stock continues to rise.
+"""
+
+
+def _top_rows(results, strategy_type):
+    """Index, row and the strikes/cost display strings for each of the top 5 results."""
+    for i, row in enumerate(results.head(5).itertuples(index=False)):
+        if strategy_type == "Bullish":
+            strikes = f"${row.long_call_strike:.2f}/{row.short_put_strike:.2f}"
+        else:
+            strikes = f"${row.long_put_strike:.2f}/{row.short_call_strike:.2f}"
+        cost_txt = f"${abs(row.net_cost):.2f} {'CR' if row.net_cost < 0 else 'DB'}"
+        yield i, row, strikes, cost_txt
+
+
 def format_text_report(results, analysis_summary, ticker, strategy_type):
     """Format analysis results into a clean, readable text report."""
     if results is None or results.empty:
         return f"No valid {strategy_type.lower()} strategies found for {ticker}."
     
     best = results.iloc[0]
-    cost_display = f"${abs(best['net_cost']):.2f} {'CREDIT' if best['net_cost'] < 0 else 'DEBIT'}"
     
     # Create summary section
     summary_lines = []
@@ -250,30 +422,13 @@ def format_text_report(results, analysis_summary, ticker, strategy_type):
     table_lines.append("RANK | EXPIRATION | STRIKES | NET COST | NET VEGA | EFFICIENCY | SCORE")
     table_lines.append("-" * 80)
     
-    for i, row in results.head(5).iterrows():
-        if strategy_type == "Bullish":
-            strikes = f"${row['long_call_strike']:.2f}/{row['short_put_strike']:.2f}"
-        else:
-            strikes = f"${row['long_put_strike']:.2f}/{row['short_call_strike']:.2f}"
-        
-        cost_txt = f"${abs(row['net_cost']):.2f} {'CR' if row['net_cost'] < 0 else 'DB'}"
-        table_lines.append(f"{i+1:4} | {row['expiration']:10} | {strikes:15} | {cost_txt:9} | {row['net_vega']:8.3f} | {row['efficiency']:9.1%} | {row['total_score']:.3f}")
+    for i, row, strikes, cost_txt in _top_rows(results, strategy_type):
+        table_lines.append(f"{i+1:4} | {row.expiration:10} | {strikes:15} | {cost_txt:9} | {row.net_vega:8.3f} | {row.efficiency:9.1%} | {row.total_score:.3f}")
     
     # Create risk warning
-    if strategy_type == "Bullish":
-        risk_warning = f"""
+    risk_warning = f"""
 ⚠️  STRATEGY OVERVIEW & RISK
-A Bullish Risk Reversal (Long OTM Call, Short OTM Put) creates a synthetic long stock position with low or zero cost. 
-The primary risk is the short put. If the stock price falls below ${best['short_put_strike']:.2f}, you may be assigned 
-100 shares per contract at that price. Maximum loss is up to ${best['max_loss_down']:.2f} per share if the stock goes to zero.
-"""
-    else:
-        risk_warning = f"""
-⚠️  STRATEGY OVERVIEW & RISK
-A Bearish Risk Reversal (Long OTM Put, Short OTM Call) creates a synthetic short stock position with low or zero cost. 
-The primary risk is the short call. If the stock price rises above ${best['short_call_strike']:.2f}, you may be assigned 
-100 shares per contract at that price. Maximum loss is unlimited if the stock continues to rise.
-"""
+{_risk_overview(best, strategy_type)}"""
     
     # Assemble the complete report
     report = f"""
@@ -282,23 +437,7 @@ The primary risk is the short call. If the stock price rises above ${best['short
 {'='*80}
 
 🎯 TOP RECOMMENDED TRADE
-Expiration: {best['expiration']} ({best['days_to_exp']} days)
-"""
-    
-    if strategy_type == "Bullish":
-        report += f"""Strikes: Long Call: ${best['long_call_strike']:.2f}, Short Put: ${best['short_put_strike']:.2f}
-Net Cost: {cost_display}
-Breakeven: ${best['breakeven']:.2f}
-Net Vega: {best['net_vega']:.3f}
-Efficiency: {best['efficiency']:.1%}
-"""
-    else:
-        report += f"""Strikes: Long Put: ${best['long_put_strike']:.2f}, Short Call: ${best['short_call_strike']:.2f}
-Net Cost: {cost_display}
-Breakeven: ${best['breakeven']:.2f}
-Net Vega: {best['net_vega']:.3f}
-Efficiency: {best['efficiency']:.1%}
-"""
+{_trade_details(best, strategy_type)}"""
     
     report += f"""
 {risk_warning}
@@ -323,156 +462,142 @@ Report generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
     return report
 
 
+def format_structured_report(results, analysis_summary, ticker, strategy_type):
+    """Build the summary/risk/pricing_comparison/top_5 dict the UI renders, without a text round trip."""
+    if results is None or results.empty:
+        return _message_result(f"No valid {strategy_type.lower()} strategies found for {ticker}.")
+    
+    best = results.iloc[0]
+    risk_lines = [line.strip() for line in _risk_overview(best, strategy_type).splitlines()]
+    risk_lines.append("")
+    risk_lines.append("🔎 ANALYSIS SUMMARY")
+    risk_lines.extend(f"{exp}: Found {count} valid trades" for exp, count in analysis_summary.items())
+    
+    top_5 = [(str(i + 1), row.expiration, strikes, cost_txt, f"{row.net_vega:.3f}",
+              f"{row.efficiency:.1%}", f"{row.total_score:.3f}")
+             for i, row, strikes, cost_txt in _top_rows(results, strategy_type)]
+    
+    return {
+        "summary": _trade_details(best, strategy_type).strip(),
+        "risk": "\n".join(risk_lines),
+        "pricing_comparison": "",
+        "top_5": top_5
+    }
+
+
 # -------------------------------
 # Main Analysis Functions
 # -------------------------------
-def run_bullish_analysis(ticker: str, min_dte: int, max_dte: int) -> str:
+def _message_result(message):
+    """Structured result carrying only a status/error message in the summary."""
+    return {"summary": message, "risk": "", "pricing_comparison": "", "top_5": []}
+
+
+def _run_analysis(ticker, min_dte, max_dte, strategy_type, report, message):
     """
-    Analyzes bullish strategies and returns a formatted text report.
+    Shared analysis pipeline. The final results go through report(final_results, analysis_summary,
+    ticker, strategy_type); every early exit goes through message(text).
     """
+    if strategy_type == "Bullish":
+        analyze, rank = analyze_bullish_risk_reversal, rank_combinations
+    else:
+        analyze, rank = analyze_bearish_risk_reversal, rank_bearish_combinations
+    label = strategy_type.lower()
     try:
         # Get stock data
-        stock = yf.Ticker(ticker)
-        history_data = stock.history(period='1d')
-        
-        if history_data.empty:
-            return f"Unable to fetch price data for {ticker}. Please check the ticker symbol and try again."
+        underlying_price = _get_underlying_price(ticker)
         
-        underlying_price = history_data['Close'].iloc[-1]
-        time.sleep(0.4)  # Gentle delay
+        if underlying_price is None:
+            return message(f"Unable to fetch price data for {ticker}. Please check the ticker symbol and try again.")
         
         today = datetime.now()
+        today_ts = pd.Timestamp(today.date())
         
         # Check for available options
         try:
-            expirations = stock.options
+            expirations = _get_expirations(ticker)
             if not expirations:
-                return f"No options data available for {ticker}. The ticker may not have an options market."
+                return message(f"No options data available for {ticker}. The ticker may not have an options market.")
         except Exception:
-             return f"Could not fetch option expiration dates for {ticker}."
+             return message(f"Could not fetch option expiration dates for {ticker}.")
 
-        valid_expirations = [exp for exp in expirations if min_dte <= (datetime.strptime(exp, "%Y-%m-%d") - today).days <= max_dte]
-        time.sleep(0.4)  # Gentle delay
+        valid_expirations = _expirations_in_range(expirations, today, min_dte, max_dte)
         
         if not valid_expirations:
-            return f"No expirations found in the specified date range for {ticker}."
+            return message(f"No expirations found in the specified date range for {ticker}.")
         
         exp_to_analyze = valid_expirations[:3]
         analysis_summary = {}
         all_combinations = []
         
+        # Fetch the option chains concurrently; each fetch is a blocking network call
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            chains = {exp: executor.submit(get_options_data, ticker, exp, underlying_price) for exp in exp_to_analyze}
+
         for expiration in exp_to_analyze:
             print(f"\n⚡ Analyzing expiration: {expiration}...")
-            time.sleep(0.4)  # Gentle delay
-            calls, puts = get_options_data(ticker, expiration, underlying_price)
+            calls, puts = chains[expiration].result()
             if calls.empty or puts.empty:
                 print(f"    - No suitable OTM options data found after cleaning.")
                 analysis_summary[expiration] = 0
                 continue
            
-            combinations = analyze_bullish_risk_reversal(calls, puts, underlying_price, expiration)
+            exp_ts = pd.Timestamp(expiration)
+            combinations = analyze(calls, puts, underlying_price, expiration, exp_ts, today_ts)
             analysis_summary[expiration] = len(combinations)
-            if combinations:
+            if not combinations.empty:
                 print(f"    ✅ Found {len(combinations)} potential combinations.")
-                all_combinations.extend(combinations)
+                all_combinations.append(combinations)
             else:
                 print(f"    - No valid combinations met the strategy criteria.")
         
         if not all_combinations:
-            return f"No valid bullish strategies found for {ticker}."
+            return message(f"No valid {label} strategies found for {ticker}.")
         
-        ranked_results = rank_combinations(all_combinations)
+        ranked_results = rank(all_combinations)
         if isinstance(ranked_results, list) and len(ranked_results) == 0:
-            return f"No valid bullish strategies found for {ticker}."
+            return message(f"No valid {label} strategies found for {ticker}.")
         
         # Ensure ranked_results is a DataFrame
         if not isinstance(ranked_results, pd.DataFrame):
-            return f"No valid bullish strategies found for {ticker}."
+            return message(f"No valid {label} strategies found for {ticker}.")
         
         final_results = ranked_results.groupby('expiration').head(3).sort_values('total_score', ascending=False).reset_index(drop=True)
         
         if final_results.empty:
-            return f"No valid bullish strategies remained after filtering for {ticker}."
+            return message(f"No valid {label} strategies remained after filtering for {ticker}.")
         
-        return format_text_report(final_results, analysis_summary, ticker, "Bullish")
+        return report(final_results, analysis_summary, ticker, strategy_type)
         
     except Exception as e:
         import traceback
         traceback.print_exc()
-        return f"An unexpected error occurred while analyzing {ticker}.\nError: {e}"
+        return message(f"An unexpected error occurred while analyzing {ticker}.\nError: {e}")
+
+
+def run_bullish_analysis(ticker: str, min_dte: int, max_dte: int) -> str:
+    """
+    Analyzes bullish strategies and returns a formatted text report.
+    """
+    return _run_analysis(ticker, min_dte, max_dte, "Bullish", format_text_report, str)
 
 
 def run_bearish_analysis(ticker: str, min_dte: int, max_dte: int) -> str:
     """
     Analyzes bearish strategies and returns a formatted text report.
     """
-    try:
-        # Get stock data
-        stock = yf.Ticker(ticker)
-        history_data = stock.history(period='1d')
-        
-        if history_data.empty:
-            return f"Unable to fetch price data for {ticker}. Please check the ticker symbol and try again."
-        
-        underlying_price = history_data['Close'].iloc[-1]
-        time.sleep(0.4)  # Gentle delay
-        
-        today = datetime.now()
-        
-        # Check for available options
-        try:
-            expirations = stock.options
-            if not expirations:
-                return f"No options data available for {ticker}. The ticker may not have an options market."
-        except Exception:
-             return f"Could not fetch option expiration dates for {ticker}."
+    return _run_analysis(ticker, min_dte, max_dte, "Bearish", format_text_report, str)
 
-        valid_expirations = [exp for exp in expirations if min_dte <= (datetime.strptime(exp, "%Y-%m-%d") - today).days <= max_dte]
-        time.sleep(0.4)  # Gentle delay
-        
-        if not valid_expirations:
-            return f"No expirations found in the specified date range for {ticker}."
-        
-        exp_to_analyze = valid_expirations[:3]
-        analysis_summary = {}
-        all_combinations = []
-        
-        for expiration in exp_to_analyze:
-            print(f"\n⚡ Analyzing expiration: {expiration}...")
-            time.sleep(0.4)  # Gentle delay
-            calls, puts = get_options_data(ticker, expiration, underlying_price)
-            if calls.empty or puts.empty:
-                print(f"    - No suitable OTM options data found after cleaning.")
-                analysis_summary[expiration] = 0
-                continue
-           
-            combinations = analyze_bearish_risk_reversal(calls, puts, underlying_price, expiration)
-            analysis_summary[expiration] = len(combinations)
-            if combinations:
-                print(f"    ✅ Found {len(combinations)} potential combinations.")
-                all_combinations.extend(combinations)
-            else:
-                print(f"    - No valid combinations met the strategy criteria.")
-        
-        if not all_combinations:
-            return f"No valid bearish strategies found for {ticker}."
-        
-        ranked_results = rank_bearish_combinations(all_combinations)
-        if isinstance(ranked_results, list) and len(ranked_results) == 0:
-            return f"No valid bearish strategies found for {ticker}."
-        
-        # Ensure ranked_results is a DataFrame
-        if not isinstance(ranked_results, pd.DataFrame):
-            return f"No valid bearish strategies found for {ticker}."
-        
-        final_results = ranked_results.groupby('expiration').head(3).sort_values('total_score', ascending=False).reset_index(drop=True)
-        
-        if final_results.empty:
-            return f"No valid bearish strategies remained after filtering for {ticker}."
-        
-        return format_text_report(final_results, analysis_summary, ticker, "Bearish")
-        
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return f"An unexpected error occurred while analyzing {ticker}.\nError: {e}"
\ No newline at end of file
+
+def run_bullish_analysis_structured(ticker: str, min_dte: int, max_dte: int) -> dict:
+    """
+    Analyzes bullish strategies and returns the summary/risk/pricing_comparison/top_5 dict the UI uses.
+    """
+    return _run_analysis(ticker, min_dte, max_dte, "Bullish", format_structured_report, _message_result)
+
+
+def run_bearish_analysis_structured(ticker: str, min_dte: int, max_dte: int) -> dict:
+    """
+    Analyzes bearish strategies and returns the summary/risk/pricing_comparison/top_5 dict the UI uses.
+    """
+    return _run_analysis(ticker, min_dte, max_dte, "Bearish", format_structured_report, _message_result)
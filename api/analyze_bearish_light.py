@@ -1,5 +1,5 @@
 from http.server import BaseHTTPRequestHandler
-import json
+import orjson
 import sys
 import os
 
@@ -14,7 +14,7 @@ class handler(BaseHTTPRequestHandler):
             # Parse request body
             content_length = int(self.headers['Content-Length'])
             post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode('utf-8'))
+            data = orjson.loads(post_data)
             
             # Extract parameters
             ticker = data.get('ticker', '').upper()
@@ -27,7 +27,7 @@ class handler(BaseHTTPRequestHandler):
                 self.send_header('Content-type', 'application/json')
                 self.send_header('Access-Control-Allow-Origin', '*')
                 self.end_headers()
-                self.wfile.write(json.dumps({'error': 'Ticker symbol is required'}).encode())
+                self.wfile.write(orjson.dumps({'error': 'Ticker symbol is required'}))
                 return
             
             # Run analysis
@@ -38,7 +38,7 @@ class handler(BaseHTTPRequestHandler):
             self.send_header('Content-type', 'application/json')
             self.send_header('Access-Control-Allow-Origin', '*')
             self.end_headers()
-            self.wfile.write(json.dumps({'result': result}).encode())
+            self.wfile.write(orjson.dumps({'result': result}))
             
         except Exception as e:
             # Send error response
@@ -54,7 +54,7 @@ class handler(BaseHTTPRequestHandler):
                     'top_5': []
                 }
             }
-            self.wfile.write(json.dumps(error_response).encode())
+            self.wfile.write(orjson.dumps(error_response))
     
     def do_OPTIONS(self):
         # Handle preflight requests
@@ -0,0 +1,82 @@
+import re
+
+# Section markers in priority order; a line containing several resolves to the first listed
+_SECTION_MARKERS = (
+    ("TOP RECOMMENDED TRADE", "summary"),
+    ("STRATEGY OVERVIEW", "risk"),
+    ("RISK", "risk"),
+    ("PRICING COMPARISON", "pricing"),
+    ("TOP 5 COMBINATIONS", "top5"),
+)
+_MARKERS_BY_SECTION = {}
+for _marker, _section in _SECTION_MARKERS:
+    _MARKERS_BY_SECTION.setdefault(_section, []).append(re.escape(_marker))
+
+# One compiled scan per line replaces the per-line .upper() and substring checks. The anchored
+# lookaheads are tried in order, so a line naming several sections resolves with the same
+# priority as before; the name of the matching group is the section.
+_SECTION_RE = re.compile(
+    '^(?:' + '|'.join(f'(?=.*(?:{"|".join(markers)}))(?P<{section}>)'
+                      for section, markers in _MARKERS_BY_SECTION.items()) + ')',
+    re.I,
+)
+
+_TABLE_HEADER_RE = re.compile(r'RANK.*EXPIRATION|EXPIRATION.*RANK', re.I)
+# Non-empty, whitespace-trimmed cells of a table row in one C-level scan (same cells as split("|") + strip + filter)
+_TABLE_CELL_RE = re.compile(r'\s*([^|]*[^|\s])')
+
+
+def parse_analysis_result(result_text):
+    """
+    Parse the analysis result text into structured data for the UI.
+    Results that are already structured (e.g. from the light engine) are returned as-is.
+    """
+    if isinstance(result_text, dict):
+        return result_text
+    lines = result_text.split('\n')
+
+    summary_lines = []
+    risk_lines = []
+    pricing_lines = []
+    top_5_data = []
+    buckets = {"summary": summary_lines, "risk": risk_lines, "pricing": pricing_lines}
+
+    current_section = None
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        # Detect sections
+        m = _SECTION_RE.match(line)
+        if m:
+            current_section = m.lastgroup
+            continue
+        elif "No valid strategies found" in line:
+            return {
+                "summary": "No valid strategies found for these parameters.",
+                "risk": "",
+                "pricing_comparison": "",
+                "top_5": []
+            }
+
+        # Add lines to appropriate section
+        if current_section == "top5":
+            # Parse table data, skip header and separator lines
+            if "|" in line and not line.startswith("---"):
+                # Skip the header row
+                if _TABLE_HEADER_RE.search(line):
+                    continue
+                parts = _TABLE_CELL_RE.findall(line)
+                if len(parts) >= 7:
+                    top_5_data.append(tuple(parts[:7]))  # Rank, Expiration, Strikes, Net Cost, Net Vega, Efficiency, Score
+        elif current_section is not None:
+            buckets[current_section].append(line)
+
+    return {
+        "summary": "\n".join(summary_lines),
+        "risk": "\n".join(risk_lines),
+        "pricing_comparison": "\n".join(pricing_lines),
+        "top_5": top_5_data
+    }
@@ -1,10 +1,15 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field
+from starlette.concurrency import run_in_threadpool
+from typing import List
+import asyncio
 from api.analyze.analysis_engine import run_bullish_analysis, run_bearish_analysis
+from api.parsers import parse_analysis_result
 import uvicorn
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Allow CORS for all origins
 app.add_middleware(
@@ -20,73 +25,17 @@ class AnalyzeRequest(BaseModel):
     min_dte: int
     max_dte: int
 
-def parse_analysis_result(result_text):
-    """
-    Parse the analysis result text into structured data for the UI.
-    """
-    lines = result_text.split('\n')
-    
-    summary_lines = []
-    risk_lines = []
-    pricing_lines = []
-    top_5_data = []
-    
-    current_section = None
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-            
-        # Detect sections
-        if "TOP RECOMMENDED TRADE" in line.upper():
-            current_section = "summary"
-            continue
-        elif "STRATEGY OVERVIEW" in line.upper() or "RISK" in line.upper():
-            current_section = "risk"
-            continue
-        elif "PRICING COMPARISON" in line.upper():
-            current_section = "pricing"
-            continue
-        elif "TOP 5 COMBINATIONS" in line.upper():
-            current_section = "top5"
-            continue
-        elif "No valid strategies found" in line:
-            return {
-                "summary": "No valid strategies found for these parameters.",
-                "risk": "",
-                "pricing_comparison": "",
-                "top_5": []
-            }
-        
-        # Add lines to appropriate section
-        if current_section == "summary":
-            summary_lines.append(line)
-        elif current_section == "risk":
-            risk_lines.append(line)
-        elif current_section == "pricing":
-            pricing_lines.append(line)
-        elif current_section == "top5":
-            # Parse table data, skip header and separator lines
-            if "|" in line and not line.startswith("---"):
-                # Skip the header row
-                if "RANK" in line.upper() and "EXPIRATION" in line.upper():
-                    continue
-                parts = [part.strip() for part in line.split("|") if part.strip()]
-                if len(parts) >= 7:
-                    top_5_data.append(tuple(parts[:7]))  # Rank, Expiration, Strikes, Net Cost, Net Vega, Efficiency, Score
-    
-    return {
-        "summary": "\n".join(summary_lines),
-        "risk": "\n".join(risk_lines),
-        "pricing_comparison": "\n".join(pricing_lines),
-        "top_5": top_5_data
-    }
+# Each item costs several Yahoo round trips, so one request may only queue a bounded number of them
+MAX_BATCH_ITEMS = 25
 
+class BatchAnalyzeRequest(BaseModel):
+    items: List[AnalyzeRequest] = Field(max_length=MAX_BATCH_ITEMS)
+
+# The engines block on Yahoo I/O, so handlers are async and hand the work to the threadpool
 @app.post("/api/analyze/bullish")
-def analyze_bullish(req: AnalyzeRequest):
+async def analyze_bullish(req: AnalyzeRequest):
     try:
-        result_text = run_bullish_analysis(req.ticker, req.min_dte, req.max_dte)
+        result_text = await run_in_threadpool(run_bullish_analysis, req.ticker, req.min_dte, req.max_dte)
         parsed_result = parse_analysis_result(result_text)
         return {"result": parsed_result}
     except Exception as e:
@@ -97,10 +46,21 @@ def analyze_bullish(req: AnalyzeRequest):
             "top_5": []
         }}
 
+@app.post("/api/analyze/bullish_batch")
+async def analyze_bullish_batch(req: BatchAnalyzeRequest):
+    # Each analysis is dominated by Yahoo round trips, so up to 10 tickers run at once; results keep input order
+    semaphore = asyncio.Semaphore(10)
+
+    async def analyze_one(item):
+        async with semaphore:
+            return await analyze_bullish(item)
+
+    return {"results": await asyncio.gather(*(analyze_one(item) for item in req.items))}
+
 @app.post("/api/analyze/bearish")
-def analyze_bearish(req: AnalyzeRequest):
+async def analyze_bearish(req: AnalyzeRequest):
     try:
-        result_text = run_bearish_analysis(req.ticker, req.min_dte, req.max_dte)
+        result_text = await run_in_threadpool(run_bearish_analysis, req.ticker, req.min_dte, req.max_dte)
         parsed_result = parse_analysis_result(result_text)
         return {"result": parsed_result}
     except Exception as e:
@@ -1,14 +1,45 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Annotated
+from contextlib import asynccontextmanager
+from cachetools import TTLCache
 import uvicorn
+import asyncio
+import threading
+import hashlib
+import gzip
 import os
 
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:  # optional; responses are gzip-compressed instead
+    BrotliMiddleware = None
+
+try:
+    import brotli
+except ImportError:  # optional; the frontend page is only precompressed with gzip
+    brotli = None
+
 # Import analysis engine
-from api.analyze.analysis_engine import run_bullish_analysis, run_bearish_analysis
+from api.analyze.analysis_engine import run_bullish_analysis_structured, run_bearish_analysis_structured, warm_up
+from api.parsers import parse_analysis_result
+
+def _warm_up():
+    """Pay first-call costs (Numba kernel, section matchers, request validation, orjson) before serving"""
+    warm_up()
+    parse_analysis_result("🎯 TOP RECOMMENDED TRADE\nExpiration: 2025-01-17\n📊 TOP 5 COMBINATIONS\n1 | a | b | c | d | e | f")
+    AnalyzeRequest(ticker="spy", min_dte=30, max_dte=90)
+    ORJSONResponse({"result": _EMPTY_RESULT})
+
+@asynccontextmanager
+async def lifespan(app):
+    await asyncio.to_thread(_warm_up)
+    yield
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # Allow CORS for all origins
 app.add_middleware(
@@ -19,108 +50,71 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON results on the wire; Brotli falls back to gzip for clients that don't accept br.
+# Responses that already carry a Content-Encoding (the pre-gzipped page) pass through untouched;
+# "/" is excluded so its identity body, sent when the client refuses br and gzip, keeps matching its ETag.
+if BrotliMiddleware is not None:
+    app.add_middleware(BrotliMiddleware, quality=4, minimum_size=512, excluded_handlers=[r"^/$"])
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
 class AnalyzeRequest(BaseModel):
-    ticker: str
-    min_dte: int
-    max_dte: int
-
-def parse_analysis_result(result_text):
-    """Parse the analysis result text into structured data for the UI."""
-    lines = result_text.split('\n')
-    
-    summary_lines = []
-    risk_lines = []
-    pricing_lines = []
-    top_5_data = []
-    
-    current_section = None
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-            
-        # Detect sections
-        if "TOP RECOMMENDED TRADE" in line.upper():
-            current_section = "summary"
-            continue
-        elif "STRATEGY OVERVIEW" in line.upper() or "RISK" in line.upper():
-            current_section = "risk"
-            continue
-        elif "PRICING COMPARISON" in line.upper():
-            current_section = "pricing"
-            continue
-        elif "TOP 5 COMBINATIONS" in line.upper():
-            current_section = "top5"
-            continue
-        elif "No valid strategies found" in line:
-            return {
-                "summary": "No valid strategies found for these parameters.",
-                "risk": "",
-                "pricing_comparison": "",
-                "top_5": []
-            }
-        
-        # Add lines to appropriate section
-        if current_section == "summary":
-            summary_lines.append(line)
-        elif current_section == "risk":
-            risk_lines.append(line)
-        elif current_section == "pricing":
-            pricing_lines.append(line)
-        elif current_section == "top5":
-            # Parse table data, skip header and separator lines
-            if "|" in line and not line.startswith("---"):
-                # Skip the header row
-                if "RANK" in line.upper() and "EXPIRATION" in line.upper():
-                    continue
-                parts = [part.strip() for part in line.split("|") if part.strip()]
-                if len(parts) >= 7:
-                    top_5_data.append(tuple(parts[:7]))  # Rank, Expiration, Strikes, Net Cost, Net Vega, Efficiency, Score
-    
-    return {
-        "summary": "\n".join(summary_lines),
-        "risk": "\n".join(risk_lines),
-        "pricing_comparison": "\n".join(pricing_lines),
-        "top_5": top_5_data
-    }
-
-@app.post("/api/analyze/bullish")
-def analyze_bullish(req: AnalyzeRequest):
-    try:
-        result_text = run_bullish_analysis(req.ticker, req.min_dte, req.max_dte)
-        parsed_result = parse_analysis_result(result_text)
-        return {"result": parsed_result}
-    except Exception as e:
-        return {"result": {
-            "summary": f"Analysis Error: {str(e)}",
-            "risk": "",
-            "pricing_comparison": "",
-            "top_5": []
-        }}
-
-@app.post("/api/analyze/bearish")
-def analyze_bearish(req: AnalyzeRequest):
+    # Malformed bodies are rejected before the engine runs. DTE has no upper bound: the Next.js proxy forwards LEAPS windows
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    ticker: Annotated[str, Field(min_length=1, max_length=10, pattern=r"^[A-Z0-9.^\-]+$")]
+    min_dte: Annotated[int, Field(ge=1)]
+    max_dte: Annotated[int, Field(ge=1)]
+
+    @field_validator("ticker", mode="before")
+    @classmethod
+    def normalize_ticker(cls, value):
+        return value.strip().upper() if isinstance(value, str) else value
+
+# Parsed results per (engine, ticker, min_dte, max_dte); repeat requests within a minute skip the engine.
+# The lock only guards the cache itself, so concurrent misses still run in parallel.
+_analysis_cache = TTLCache(maxsize=512, ttl=60)
+_analysis_cache_lock = threading.Lock()
+
+# Shared shape for error results; only the summary message differs per request
+_EMPTY_RESULT = {"summary": "", "risk": "", "pricing_comparison": "", "top_5": ()}
+
+def _cached_analysis(run_analysis, ticker, min_dte, max_dte):
+    key = (run_analysis.__name__, ticker.upper(), min_dte, max_dte)
+    with _analysis_cache_lock:
+        parsed_result = _analysis_cache.get(key)
+    if parsed_result is None:
+        # Structured engines return the UI dict directly; the parser is only a fallback for text reports
+        parsed_result = parse_analysis_result(run_analysis(*key[1:]))
+        # Unexpected errors are usually transient (Yahoo hiccups), so they are not cached
+        if not parsed_result["summary"].startswith("An unexpected error occurred"):
+            with _analysis_cache_lock:
+                _analysis_cache[key] = parsed_result
+    return parsed_result
+
+_ENGINES = {
+    "bullish": run_bullish_analysis_structured,
+    "bearish": run_bearish_analysis_structured,
+}
+
+@app.post("/api/analyze/{strategy}")
+async def analyze(strategy: str, req: AnalyzeRequest):
+    run_analysis = _ENGINES.get(strategy)
+    if run_analysis is None:
+        raise HTTPException(status_code=404, detail=f"Unknown strategy: {strategy}")
     try:
-        result_text = run_bearish_analysis(req.ticker, req.min_dte, req.max_dte)
-        parsed_result = parse_analysis_result(result_text)
+        # The engine blocks on Yahoo requests; run it in a worker thread so the event loop stays free
+        parsed_result = await asyncio.to_thread(_cached_analysis, run_analysis, req.ticker, req.min_dte, req.max_dte)
         return {"result": parsed_result}
     except Exception as e:
-        return {"result": {
-            "summary": f"Analysis Error: {str(e)}",
-            "risk": "",
-            "pricing_comparison": "",
-            "top_5": []
-        }}
+        return ORJSONResponse({"result": {**_EMPTY_RESULT, "summary": f"Analysis Error: {e}"}})
 
 @app.get("/health")
 def health_check():
     return {"status": "healthy", "message": "VegaEdge API is running"}
 
-@app.get("/")
-def serve_frontend():
-    """Serve a simple HTML frontend"""
-    html_content = """
+# The frontend page is static, so it is encoded, hashed and compressed once at import
+_FRONTEND_HTML = """
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -332,8 +326,74 @@ def serve_frontend():
     </body>
     </html>
     """
-    return HTMLResponse(content=html_content)
+_FRONTEND_HTML_BYTES = _FRONTEND_HTML.encode("utf-8")
+_FRONTEND_DIGEST = hashlib.sha1(_FRONTEND_HTML_BYTES).hexdigest()
+_FRONTEND_HEADERS = {"Cache-Control": "public, max-age=3600", "Vary": "Accept-Encoding"}
+
+def _frontend_variant(body, content_encoding=None):
+    """Body plus complete response headers (including Content-Length) for one encoding of the page.
+    Each encoding gets its own strong ETag, since the bytes on the wire differ"""
+    etag = f'"{_FRONTEND_DIGEST}-{content_encoding}"' if content_encoding else f'"{_FRONTEND_DIGEST}"'
+    headers = {**_FRONTEND_HEADERS, "ETag": etag, "Content-Length": str(len(body))}
+    if content_encoding:
+        headers["Content-Encoding"] = content_encoding
+    return body, headers
+
+_FRONTEND_IDENTITY = _frontend_variant(_FRONTEND_HTML_BYTES)
+_FRONTEND_GZIP = _frontend_variant(gzip.compress(_FRONTEND_HTML_BYTES, compresslevel=9, mtime=0), "gzip")
+# Max-quality Brotli is too slow per request but free at import
+_FRONTEND_BR = _frontend_variant(brotli.compress(_FRONTEND_HTML_BYTES, quality=11), "br") if brotli is not None else None
+
+def _encoding_qvalues(accept_encoding):
+    """Content-coding -> q-value from an Accept-Encoding header (codings without q= default to 1)"""
+    qvalues = {}
+    for item in accept_encoding.split(","):
+        coding, *params = item.split(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[coding] = q
+    return qvalues
+
+def _frontend_variant_for(accept_encoding):
+    """Highest-q precompressed variant the client accepts (br wins ties), else the identity body"""
+    qvalues = _encoding_qvalues(accept_encoding)
+    wildcard = qvalues.get("*", 0.0)
+    best, best_q = _FRONTEND_IDENTITY, 0.0
+    for coding, variant in (("br", _FRONTEND_BR), ("gzip", _FRONTEND_GZIP)):
+        q = qvalues.get(coding, wildcard)
+        if variant is not None and q > best_q:
+            best, best_q = variant, q
+    return best
+
+def _etag_matches(if_none_match, etag):
+    """Weak If-None-Match comparison of etag against the header's list (or *)"""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+@app.get("/")
+async def serve_frontend(request: Request):
+    """Serve a simple HTML frontend"""
+    body, headers = _frontend_variant_for(request.headers.get("accept-encoding", ""))
+    if _etag_matches(request.headers.get("if-none-match", ""), headers["ETag"]):
+        return Response(status_code=304, headers={**_FRONTEND_HEADERS, "ETag": headers["ETag"]})
+    return HTMLResponse(content=body, headers=headers)
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Every worker loads pandas/numba/scipy and keeps its own result cache; WEB_CONCURRENCY opts into more
+    workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+    # Multiple workers need the app as an import string; uvloop and httptools come from uvicorn[standard]
+    uvicorn.run("main:app", host="0.0.0.0", port=port, workers=workers,
+                loop="uvloop", http="httptools", proxy_headers=True, access_log=False)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Make the repo root importable (api.*, main, backend) however pytest is invoked
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,99 @@
+"""bs_greeks (numba kernel and NumPy fallback) against a scalar scipy reference."""
+import math
+
+import numpy as np
+import pytest
+from scipy.stats import norm
+
+import api.analysis_engine as vercel_engine
+import api.analyze.analysis_engine as server_engine
+
+# _greeks_njit is compiled with fastmath=True, which may reassociate the arithmetic; on these
+# magnitudes (|delta| <= 1, vega < 1) that moves results by a few ulps, far inside this bound.
+ATOL = 1e-10
+
+ENGINES = [server_engine, vercel_engine]
+
+S = 100.0
+R = 0.045
+STRIKES = np.array([40.0, 80.0, 95.0, 99.99, 100.0, 100.01, 105.0, 125.0, 180.0])
+IVS = np.array([0.9, 0.35, 0.25, 0.2, 0.2, 0.2, 0.22, 0.4, 1.5])
+
+
+def reference_greeks(S, K, T, r, sigma, option_type, q=0.0):
+    """Textbook Black-Scholes vega (per 1 vol point) and delta for one option."""
+    disc = math.exp(-q * T)
+    if T <= 0:
+        if option_type == 'call':
+            return 0.0, 1.0 if S > K else 0.0
+        return 0.0, -1.0 if S < K else 0.0
+    if sigma <= 0:
+        cdf = 1.0 if S > K else 0.0
+        return 0.0, disc * cdf if option_type == 'call' else disc * (cdf - 1.0)
+    d1 = (math.log(S / K) + (r - q + 0.5 * sigma ** 2) * T) / (sigma * math.sqrt(T))
+    vega = S * disc * norm.pdf(d1) * math.sqrt(T) / 100
+    cdf = norm.cdf(d1)
+    return vega, disc * cdf if option_type == 'call' else disc * (cdf - 1.0)
+
+
+def assert_matches_reference(engine, S, strikes, T, r, ivs, option_type, q=0.0):
+    vega, delta = engine.bs_greeks(S, strikes, T, r, ivs, option_type, q)
+    expected = [reference_greeks(S, k, T, r, iv, option_type, q) for k, iv in zip(strikes, ivs)]
+    np.testing.assert_allclose(vega, [v for v, _ in expected], rtol=0, atol=ATOL)
+    np.testing.assert_allclose(delta, [d for _, d in expected], rtol=0, atol=ATOL)
+
+
+@pytest.fixture(params=['numba', 'numpy'])
+def greeks_path(request, monkeypatch):
+    """Run each test once through _greeks_njit and once through the NumPy fallback."""
+    if request.param == 'numba':
+        if server_engine._greeks_njit is None:
+            pytest.skip('numba is not installed')
+    else:
+        for engine in ENGINES:
+            monkeypatch.setattr(engine, '_greeks_njit', None)
+    return request.param
+
+
+@pytest.mark.parametrize('engine', ENGINES, ids=['api.analyze', 'api'])
+@pytest.mark.parametrize('option_type', ['call', 'put'])
+@pytest.mark.parametrize('T', [1 / 365, 30 / 365, 0.5, 2.0])
+def test_matches_reference(greeks_path, engine, option_type, T):
+    assert_matches_reference(engine, S, STRIKES, T, R, IVS, option_type)
+
+
+@pytest.mark.parametrize('engine', ENGINES, ids=['api.analyze', 'api'])
+@pytest.mark.parametrize('option_type', ['call', 'put'])
+def test_dividend_yield(greeks_path, engine, option_type):
+    assert_matches_reference(engine, S, STRIKES, 0.25, R, IVS, option_type, q=0.02)
+
+
+@pytest.mark.parametrize('engine', ENGINES, ids=['api.analyze', 'api'])
+@pytest.mark.parametrize('option_type', ['call', 'put'])
+def test_non_positive_iv(greeks_path, engine, option_type):
+    """IV <= 0 gives zero vega and the intrinsic (discounted step) delta, with no NaNs."""
+    strikes = np.array([90.0, 100.0, 110.0, 90.0, 110.0])
+    ivs = np.array([0.0, 0.0, 0.0, -0.1, -0.1])
+    vega, delta = engine.bs_greeks(S, strikes, 0.25, R, ivs, option_type)
+    assert not np.isnan(vega).any() and not np.isnan(delta).any()
+    np.testing.assert_array_equal(vega, 0.0)
+    assert_matches_reference(engine, S, strikes, 0.25, R, ivs, option_type)
+
+
+@pytest.mark.parametrize('engine', ENGINES, ids=['api.analyze', 'api'])
+def test_strike_equals_spot(greeks_path, engine):
+    """At the money d1 reduces to (r + sigma^2 / 2) * sqrt(T) / sigma; call minus put delta is the discount factor."""
+    strikes = np.array([S, S, S])
+    ivs = np.array([0.1, 0.3, 0.8])
+    T = 0.25
+    assert_matches_reference(engine, S, strikes, T, R, ivs, 'call')
+    assert_matches_reference(engine, S, strikes, T, R, ivs, 'put')
+    _, call_delta = engine.bs_greeks(S, strikes, T, R, ivs, 'call')
+    _, put_delta = engine.bs_greeks(S, strikes, T, R, ivs, 'put')
+    np.testing.assert_allclose(call_delta - put_delta, 1.0, rtol=0, atol=ATOL)
+
+
+@pytest.mark.parametrize('engine', ENGINES, ids=['api.analyze', 'api'])
+@pytest.mark.parametrize('option_type', ['call', 'put'])
+def test_expired(greeks_path, engine, option_type):
+    assert_matches_reference(engine, S, STRIKES, 0.0, R, IVS, option_type)